@@ -22,10 +22,13 @@ from sternhalma import (
 
 
 class Agent(ABC):
-    def __init__(self):
+    def __init__(self, seed: int | None = None):
         # Board state
         self.board: Board = Board.two_players()
 
+        # Random number generator
+        self.rng: np.random.Generator = np.random.default_rng(seed)
+
     async def play(self, client: Client) -> GameResult:
         logging.info("Agent started playing...")
         while True:
@@ -33,11 +36,11 @@ class Agent(ABC):
                 case ServerMessageTurn(movements):
                     logging.debug("It's my turn")
                     movement_index: int = self.decide_movement(movements)
-                    logging.debug(f"Chosen movement index: {movement_index}")
+                    logging.debug("Chosen movement index: %d", movement_index)
                     await client.send_message(ClientMessageChoice(movement_index))
 
                 case ServerMessageMovement(player, indices):
-                    logging.debug(f"Player {player} made move {indices}")
+                    logging.debug("Player %s made move %s", player, indices)
                     self.board.apply_movement(indices)
                     # agent.board.print()
 
@@ -70,15 +73,15 @@ class AgentConstant(Agent):
 class AgentBrownian(Agent):
     @override
     def decide_movement(self, movements: NDArray[np.int_]) -> int:
-        return np.random.randint(0, len(movements))
+        return int(self.rng.integers(len(movements)))
 
 
 @final
 class AgentDQN(Agent):
     @override
-    def __init__(self):
+    def __init__(self, seed: int | None = None):
         # Parent constructor
-        super().__init__()
+        super().__init__(seed)
 
         # Neural network
         self.nn = None
@@ -1,11 +1,24 @@
-from typing import override
+from collections.abc import Sequence
+from typing import Self, override
 import numpy as np
 import torch as T
 import torch.nn as nn
 import torch.nn.functional as F
+from torch.nn.utils.fusion import fuse_conv_bn_eval
 
 from sternhalma import Board, Position
 
+# Lookup table mapping each `Position` value to its three input channels.
+# Columns are indexed directly by the raw board values, so `Position.Invalid` (-1)
+# wraps around to the last column, which is left as all zeros.
+_CHANNEL_LUT = np.zeros((3, len(Position)), dtype=np.float32)
+_CHANNEL_LUT[0, Position.Player1] = 1
+_CHANNEL_LUT[1, Position.Player2] = 1
+_CHANNEL_LUT[2, [Position.Empty, Position.Player1, Position.Player2]] = 1
+
+# Channel axis used to broadcast the lookup table gather over a batch of boards
+_CHANNELS = np.arange(3)[:, np.newaxis, np.newaxis]
+
 
 def from_state(board: Board, device: str = "cuda") -> T.Tensor:
     """
@@ -26,22 +39,45 @@ def from_state(board: Board, device: str = "cuda") -> T.Tensor:
     Returns:
         A tensor of shape (1, 3, 17, 17) ready for the network.
     """
-    tensor = np.zeros((3, 17, 17), dtype=np.float32)
+    return from_states([board], device)
+
+
+def from_states(boards: Sequence[Board], device: str = "cuda") -> T.Tensor:
+    """
+    Converts a batch of board states to the canonical tensor representation.
+
+    Each board is encoded exactly as in `from_state`, so a whole batch of positions
+    can be evaluated with a single forward pass through the network.
+
+    Args:
+        boards: The board states to encode (in relative coordinates).
+        device: The device (e.g., "cpu", "cuda") where the tensor will be allocated.
+
+    Returns:
+        A tensor of shape (N, 3, 17, 17) ready for the network.
+    """
+    states = np.stack([board.state for board in boards])
 
-    # Determine masks based on player identity
     # Channel 0 is always "me" (Player 1), Channel 1 is always "opponent" (Player 2)
-    # The board is assumed to be in relative coordinates where "me" == Player 1.
-    friend_mask = board.state == Position.Player1
-    enemy_mask = board.state == Position.Player2
+    # The boards are assumed to be in relative coordinates where "me" == Player 1.
+
+    # Stage CUDA transfers through page-locked memory so the copy runs asynchronously
+    # and can overlap with work already queued on the device.
+    if T.device(device).type == "cuda":
+        # Gather each channel straight into the pinned buffer, skipping the intermediate
+        # host array. The "wrap" mode maps `Position.Invalid` (-1) to the last column.
+        batch = T.empty((len(states), 3, 17, 17), dtype=T.float32, pin_memory=True)
+        buffer = batch.numpy()
+        for channel, lut in enumerate(_CHANNEL_LUT):
+            _ = np.take(lut, states, out=buffer[:, channel], mode="wrap")
 
-    # Set masks for each channel
-    tensor[0] = friend_mask.astype(np.float32)
-    tensor[1] = enemy_mask.astype(np.float32)
-    # Channel 2 is invariant (just valid positions)
-    tensor[2] = (board.state != Position.Invalid).astype(np.float32)
+        return batch.to(device, non_blocking=True)
 
-    # Convert to torch tensor, add batch dimension (N=1), and move to device
-    return T.from_numpy(tensor.copy()).unsqueeze(0).to(device)
+    # Gather all three channels of every board in a single pass.
+    # The gather produces a fresh contiguous array, so no extra copy is needed.
+    tensor = _CHANNEL_LUT[_CHANNELS, states[:, np.newaxis]]
+
+    return T.from_numpy(tensor).to(device)
 
 
 class ResBlock(nn.Module):
@@ -95,6 +131,16 @@ class ResBlock(nn.Module):
         # Final ReLU activation.
         return F.relu(x)
 
+    @T.no_grad()
+    def fuse_for_inference(self) -> None:
+        """
+        Folds each batch normalization into the preceding convolution.
+
+        The block must be in evaluation mode. The fusion is irreversible.
+        """
+        self.conv1, self.bn1 = fuse_conv_bn_eval(self.conv1, self.bn1), nn.Identity()
+        self.conv2, self.bn2 = fuse_conv_bn_eval(self.conv2, self.bn2), nn.Identity()
+
 
 class SternhalmaZero(nn.Module):
     """
@@ -154,14 +200,166 @@ class SternhalmaZero(nn.Module):
 
         # Policy Head: Conv -> BN -> ReLU -> Flatten -> Linear.
         policy = F.relu(self.policy_bn(self.policy_conv(x)))
-        policy = policy.view(policy.size(0), -1)
+        # `flatten` copies if needed, as channels-last activations cannot be viewed flat
+        policy = policy.flatten(1)
         policy = self.policy_fc(policy)
 
         # Value Head: Conv -> BN -> ReLU -> Flatten -> Linear -> ReLU -> Linear.
         value = F.relu(self.value_bn(self.value_conv(x)))
-        value = value.view(value.size(0), -1)
+        value = value.flatten(1)
         value = self.value_fc1(value)
         value = F.relu(value)
         value = self.value_fc2(value)
 
         return policy, value
+
+    @T.no_grad()
+    def fuse_for_inference(self) -> Self:
+        """
+        Folds every batch normalization into the preceding convolution.
+
+        In evaluation mode each BatchNorm is an affine transform of its input, so it can be
+        absorbed into the weights and bias of the convolution before it. This halves the
+        number of kernels in the backbone and heads without changing the outputs.
+
+        The fusion is irreversible, so the model can no longer be trained afterwards.
+        Call this on a dedicated inference copy, before `prepare_inference`.
+
+        Returns:
+            Self: The model itself, to allow chaining.
+        """
+        _ = self.eval()
+
+        self.start_conv, self.start_bn = (
+            fuse_conv_bn_eval(self.start_conv, self.start_bn),
+            nn.Identity(),
+        )
+
+        for block in self.backbone:
+            if isinstance(block, ResBlock):
+                block.fuse_for_inference()
+
+        self.policy_conv, self.policy_bn = (
+            fuse_conv_bn_eval(self.policy_conv, self.policy_bn),
+            nn.Identity(),
+        )
+        self.value_conv, self.value_bn = (
+            fuse_conv_bn_eval(self.value_conv, self.value_bn),
+            nn.Identity(),
+        )
+
+        return self
+
+    def prepare_inference(self, compiled: bool = False) -> Self:
+        """
+        Prepares the model for inference-only use (e.g. evaluating positions during search).
+
+        Switches the model to evaluation mode and stores the convolution weights in
+        channels-last memory format, which is the layout favoured by tensor cores.
+        The training path is left untouched, as `train()` can be called again at any time.
+
+        Args:
+            compiled (bool): Whether to compile the model with TorchInductor. Fuses the
+                element-wise BN/ReLU/residual ops of each block into fewer kernels and
+                captures the forward pass in CUDA graphs. Keep the batch size fixed, since
+                each new input shape triggers a recompilation.
+
+        Returns:
+            Self: The model itself, to allow chaining.
+        """
+        _ = self.eval()
+        model = self.to(memory_format=T.channels_last)
+
+        if compiled:
+            model.compile(mode="reduce-overhead", fullgraph=True, dynamic=False)
+
+        return model
+
+    @T.inference_mode()
+    def predict(self, x: T.Tensor) -> tuple[T.Tensor, T.Tensor]:
+        """
+        Evaluates a batch of positions without tracking gradients.
+
+        On CUDA devices the forward pass runs under bfloat16 autocast, halving the memory
+        traffic of the convolutional stack. Outputs are always returned in float32.
+
+        Args:
+            x (T.Tensor): Input tensor of shape (N, 3, board_size, board_size).
+
+        Returns:
+            tuple[T.Tensor, T.Tensor]: Policy logits of shape (N, num_actions)
+                and value estimates of shape (N, 1).
+        """
+        x = x.to(memory_format=T.channels_last)
+        with T.autocast(
+            device_type=x.device.type,
+            dtype=T.bfloat16,
+            enabled=x.device.type == "cuda",
+        ):
+            policy, value = self(x)
+
+        return policy.float(), value.float()
+
+
+class EvaluationCache:
+    """
+    Bounded transposition table of network evaluations.
+
+    Positions are keyed by their Zobrist hash, so a position reached again during search
+    is served from the cache instead of running another forward pass.
+    When the cache is full, the oldest entry is evicted first.
+
+    Evaluations are stored on the CPU, so the cache never holds on to device memory,
+    and every lookup returns a copy that the caller is free to modify in-place.
+    """
+
+    def __init__(
+        self, model: SternhalmaZero, capacity: int = 2**16, device: str = "cuda"
+    ) -> None:
+        """
+        Initializes an empty evaluation cache.
+
+        Args:
+            model (SternhalmaZero): The network used to evaluate positions missing from the cache.
+            capacity (int): Maximum number of cached evaluations. Each entry holds a policy
+                of `num_actions` floats, so the default stays within a few hundred MiB.
+            device (str): The device where the input tensors are allocated.
+
+        Raises:
+            ValueError: If `capacity` is not positive.
+        """
+        if capacity <= 0:
+            raise ValueError(f"Cache capacity must be positive, got {capacity}")
+
+        self.model = model
+        self.capacity = capacity
+        self.device = device
+
+        # Evaluations indexed by Zobrist hash, in insertion order.
+        self.entries: dict[int, tuple[T.Tensor, T.Tensor]] = {}
+
+    def evaluate(self, board: Board) -> tuple[T.Tensor, T.Tensor]:
+        """
+        Evaluates a position, reusing the cached result if it has been seen before.
+
+        Args:
+            board (Board): The board state (in relative coordinates).
+
+        Returns:
+            tuple[T.Tensor, T.Tensor]: Policy logits of shape (1, num_actions)
+                and value estimate of shape (1, 1), on the CPU.
+        """
+        key = board.zobrist_hash()
+        if (evaluation := self.entries.get(key)) is None:
+            policy, value = self.model.predict(from_state(board, self.device))
+            evaluation = (policy.cpu(), value.cpu())
+
+            # Evict the oldest entry when the cache is full.
+            if len(self.entries) >= self.capacity:
+                del self.entries[next(iter(self.entries))]
+
+            self.entries[key] = evaluation
+
+        # Hand out copies so the cached tensors cannot be modified by the caller.
+        policy, value = evaluation
+        return policy.clone(), value.clone()
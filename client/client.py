@@ -1,12 +1,12 @@
 import asyncio
+import io
 
 import cbor2
 import struct
 import logging
-from typing import Any, final
-
-
-from utils import printer
+import socket
+from collections.abc import Iterable
+from typing import final, override
 
 
 from .protocol import (
@@ -19,6 +19,246 @@ from .protocol import (
 )
 
 
+# Initial capacity of the receive buffer
+RECEIVE_BUFFER_SIZE = 64 * 1024  # 64 KiB
+
+# Length prefix of each frame (4-byte big-endian unsigned integer)
+LENGTH_PREFIX = struct.Struct(">I")
+
+# Largest frame payload accepted from the server
+MAX_FRAME_SIZE = 16 * 1024 * 1024  # 16 MiB
+
+# Number of queued frames after which reading from the socket is paused
+MAX_QUEUED_FRAMES = 16
+
+
+@final
+class FrameProtocol(asyncio.BufferedProtocol):
+    """Receives length-prefixed frames directly into a reusable buffer
+
+    The transport writes incoming data straight into a preallocated `bytearray`,
+    where complete frames (4-byte big-endian length followed by the payload)
+    are sliced out and queued, avoiding the intermediate copies of `StreamReader`.
+    """
+
+    def __init__(
+        self,
+        buffer_size: int = RECEIVE_BUFFER_SIZE,
+        timeout: float = 30,
+        max_frame_size: int = MAX_FRAME_SIZE,
+        max_queued_frames: int = MAX_QUEUED_FRAMES,
+    ):
+        """Initialize the protocol.
+
+        Args:
+            buffer_size (int): Initial capacity of the receive buffer.
+            timeout (float): Inactivity timeout after which the connection is aborted.
+            max_frame_size (int): Largest frame payload accepted before aborting.
+            max_queued_frames (int): Number of unread frames after which reading
+                is paused until they are consumed.
+        """
+
+        # Receive buffer and the number of bytes currently stored in it
+        self.buffer = bytearray(buffer_size)
+        self.view = memoryview(self.buffer)
+        self.filled = 0
+
+        # Size of the frame currently being received, if larger than what is buffered
+        self.pending = 0
+        self.max_frame_size = max_frame_size
+
+        # Complete frames, with `None` marking the end of the stream
+        self.frames: asyncio.Queue[bytes | None] = asyncio.Queue()
+
+        # Flow control for incoming data
+        # Reading is paused while too many frames are waiting to be consumed,
+        # so that a busy agent does not queue everything the server sends
+        self.max_queued_frames = max_queued_frames
+        self.reading_paused = False
+
+        self.transport: asyncio.Transport | None = None
+
+        # Flow control for outgoing data
+        self.drain_waiter: asyncio.Future[None] | None = None
+        self.closed: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+
+        # Inactivity watchdog
+        # The timeout only runs while a read or drain is waiting, so the time the agent
+        # spends deciding its move is never counted against the server.
+        # A single timer is kept per connection: receiving data only records the time,
+        # and the timer reschedules itself if there was activity since it was set.
+        self.timeout = timeout
+        self.last_activity = 0.0
+        self.waiting = 0
+        self.watchdog: asyncio.TimerHandle | None = None
+
+        # Error detected by the protocol itself, reported to readers and writers
+        self.error: Exception | None = None
+
+    @override
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        assert isinstance(transport, asyncio.Transport)
+        self.transport = transport
+
+    def start_waiting(self) -> None:
+        """Start the timeout of a read or drain that is about to wait"""
+
+        loop = asyncio.get_running_loop()
+        self.last_activity = loop.time()
+        self.waiting += 1
+        if self.watchdog is None:
+            self.watchdog = loop.call_later(self.timeout, self.check_activity)
+
+    def check_activity(self) -> None:
+        """Abort the connection if a wait made no progress within the timeout"""
+
+        # Nothing is waiting anymore, the timer is restarted by the next wait
+        if self.waiting == 0:
+            self.watchdog = None
+            return
+
+        loop = asyncio.get_running_loop()
+        deadline = self.last_activity + self.timeout
+        if loop.time() < deadline:
+            self.watchdog = loop.call_at(deadline, self.check_activity)
+            return
+
+        self.watchdog = None
+        self.fail(TimeoutError(f"No data received for {self.timeout}s"))
+
+    def fail(self, error: Exception) -> None:
+        """Abort the connection, reporting `error` to pending and future operations"""
+
+        self.error = error
+        if self.transport is not None:
+            self.transport.abort()
+
+    @override
+    def get_buffer(self, sizehint: int) -> memoryview:
+        # Grow the buffer when it is full or too small for the pending frame
+        required = max(self.pending, self.filled + 1)
+        if required > len(self.buffer):
+            # Move the buffered bytes to a new buffer rather than resizing in place,
+            # which fails while views handed out earlier are still alive
+            buffer = bytearray(max(required, 2 * len(self.buffer)))
+            buffer[: self.filled] = self.view[: self.filled]
+            self.buffer, self.view = buffer, memoryview(buffer)
+
+        return self.view[self.filled :]
+
+    @override
+    def buffer_updated(self, nbytes: int) -> None:
+        self.last_activity = asyncio.get_running_loop().time()
+        self.filled += nbytes
+
+        # Slice out every complete frame in the buffer
+        start = 0
+        while self.filled - start >= LENGTH_PREFIX.size:
+            (length,) = LENGTH_PREFIX.unpack_from(self.view, start)
+            if length > self.max_frame_size:
+                # Reject the frame before growing the buffer for it
+                self.fail(ValueError(f"Frame too large: {length} bytes"))
+                return
+
+            end = start + LENGTH_PREFIX.size + length
+            if end > self.filled:
+                break
+
+            self.frames.put_nowait(bytes(self.view[start + LENGTH_PREFIX.size : end]))
+            start = end
+
+        if (
+            not self.reading_paused
+            and self.frames.qsize() >= self.max_queued_frames
+            and self.transport is not None
+        ):
+            self.transport.pause_reading()
+            self.reading_paused = True
+
+        # Move any partial frame to the beginning of the buffer
+        if start > 0:
+            self.view[: self.filled - start] = self.view[start : self.filled]
+            self.filled -= start
+
+        self.pending = (
+            LENGTH_PREFIX.size + LENGTH_PREFIX.unpack_from(self.view)[0]
+            if self.filled >= LENGTH_PREFIX.size
+            else 0
+        )
+
+    @override
+    def connection_lost(self, exc: Exception | None) -> None:
+        if self.watchdog is not None:
+            self.watchdog.cancel()
+            self.watchdog = None
+
+        self.frames.put_nowait(None)
+
+        # Wake up any writer waiting for the buffer to drain
+        if self.drain_waiter is not None and not self.drain_waiter.done():
+            self.drain_waiter.set_exception(
+                self.error or exc or ConnectionResetError("Connection lost")
+            )
+
+        if not self.closed.done():
+            self.closed.set_result(None)
+
+    @override
+    def pause_writing(self) -> None:
+        self.drain_waiter = asyncio.get_running_loop().create_future()
+
+    @override
+    def resume_writing(self) -> None:
+        if self.drain_waiter is not None and not self.drain_waiter.done():
+            self.drain_waiter.set_result(None)
+        self.drain_waiter = None
+
+    async def read_frame(self) -> bytes:
+        """Wait for the next complete frame"""
+
+        if self.frames.empty():
+            self.start_waiting()
+            try:
+                frame = await self.frames.get()
+            finally:
+                self.waiting -= 1
+        else:
+            frame = self.frames.get_nowait()
+
+        # Resume reading once the queued frames have been consumed
+        if (
+            self.reading_paused
+            and self.frames.qsize() < self.max_queued_frames
+            and self.transport is not None
+        ):
+            self.transport.resume_reading()
+            self.reading_paused = False
+
+        if frame is None:
+            # Keep the end of stream mark for subsequent reads
+            self.frames.put_nowait(None)
+            if self.error is not None:
+                raise self.error
+            raise ConnectionResetError("Connnection closed by the server")
+
+        return frame
+
+    async def drain(self) -> None:
+        """Wait until the transport write buffer is below its high-water mark"""
+
+        if self.closed.done():
+            if self.error is not None:
+                raise self.error
+            raise ConnectionResetError("Connection lost")
+
+        if self.drain_waiter is not None:
+            self.start_waiting()
+            try:
+                await self.drain_waiter
+            finally:
+                self.waiting -= 1
+
+
 @final
 class Client:
     """Async TCP client for connecting to the game server"""
@@ -30,6 +270,9 @@ class Client:
         timeout: int = 30,  # 30s
         delay: float = 0.500,  # 500ms
         attempts: int = 20,
+        buffer_size: int = RECEIVE_BUFFER_SIZE,
+        socket_buffer_size: int | None = None,
+        max_frame_size: int = MAX_FRAME_SIZE,
     ):
         """Connect to the game server.
 
@@ -39,6 +282,10 @@ class Client:
             timeout (int): Connection timeout.
             delay (float): Connection retry delay.
             attempts (int): Number of connection attempts.
+            buffer_size (int): Initial capacity of the receive buffer.
+            socket_buffer_size (int | None): Size of the kernel send and receive
+                buffers of the socket. Left to the operating system if `None`.
+            max_frame_size (int): Largest message accepted from the server.
         """
 
         # Socket connection parameters
@@ -51,9 +298,19 @@ class Client:
         self.delay = delay
         self.attempts = attempts
 
-        # Stream reader and writer
-        self.reader: asyncio.StreamReader | None = None
-        self.writer: asyncio.StreamWriter | None = None
+        # Receive buffer parameters
+        self.buffer_size = buffer_size
+        self.socket_buffer_size = socket_buffer_size
+        self.max_frame_size = max_frame_size
+
+        # Socket transport and framing protocol
+        self.transport: asyncio.Transport | None = None
+        self.protocol: FrameProtocol | None = None
+
+        # CBOR encoder reused for every message, pointed at each frame's stream in turn
+        # Frames are decoded independently, since a decoder keeps the values shared
+        # by earlier data for the rest of its life
+        self.encoder = cbor2.CBOREncoder(io.BytesIO())
 
         self.session_id: str | None = None
 
@@ -63,11 +320,24 @@ class Client:
         logging.info(f"Connecting to server at {self.host}:{self.port}")
         for attempt in range(self.attempts):
             try:
-                self.reader, self.writer = await asyncio.open_connection(
-                    self.host, self.port
+                loop = asyncio.get_running_loop()
+                self.transport, self.protocol = await loop.create_connection(
+                    lambda: FrameProtocol(
+                        self.buffer_size, self.timeout, self.max_frame_size
+                    ),
+                    self.host,
+                    self.port,
                 )
                 logging.info("Connection established successfully")
 
+                # Size the kernel socket buffers
+                if self.socket_buffer_size is not None:
+                    sock = self.transport.get_extra_info("socket")
+                    for option in (socket.SO_SNDBUF, socket.SO_RCVBUF):
+                        sock.setsockopt(
+                            socket.SOL_SOCKET, option, self.socket_buffer_size
+                        )
+
                 # Send Hello immediately after connection
                 if self.session_id:
                     logging.info(
@@ -80,9 +350,10 @@ class Client:
                 return self
 
             # If the connection fails, log the error, wait and retry
-            except (ConnectionRefusedError, OSError):
+            # (`ConnectionRefusedError` is itself an `OSError`)
+            except OSError as e:
                 logging.error(
-                    f"Connection refused. Retrying {attempt + 1}/{self.attempts}"
+                    f"Connection failed ({e}). Retrying {attempt + 1}/{self.attempts}"
                 )
                 await asyncio.sleep(self.delay)
                 continue
@@ -100,9 +371,9 @@ class Client:
     async def __aexit__(self, exc_type, exc_val, exc_tb):  # pyright: ignore [reportMissingParameterType, reportUnknownParameterType]
         """Exit the async context manager"""
 
-        if self.writer:
-            self.writer.close()
-            await self.writer.wait_closed()
+        if self.transport and self.protocol:
+            self.transport.close()
+            await self.protocol.closed
             logging.info("Connection closed")
 
         # Handle exceptions that occurred during the context
@@ -115,47 +386,21 @@ class Client:
     async def receive_message(self) -> ServerMessage:
         """Receive a message from the server"""
 
-        logging.debug("Waiting for server...")
-
-        if self.reader is None:
+        if self.protocol is None:
             raise ConnectionError("Client not connected")
 
-        # Read the 4-byte length prefix
-        try:
-            length_bytes = await asyncio.wait_for(
-                self.reader.readexactly(4), timeout=self.timeout
-            )
-        except asyncio.IncompleteReadError as e:
-            bytes_read = len(e.partial)
-            if bytes_read == 0:
-                raise ConnectionResetError("Connnection closed by the server")
-            else:
-                raise
-
-        length = int.from_bytes(length_bytes)
-        logging.debug(f"Message length: {length} bytes")
-
-        # Read the actual message payload
-        try:
-            message_bytes = await asyncio.wait_for(
-                self.reader.readexactly(length), timeout=self.timeout
-            )
-        except asyncio.IncompleteReadError as e:
-            bytes_read = len(e.partial)
-            if bytes_read == 0:
-                raise ConnectionResetError("Connnection closed by the server")
-            else:
-                raise
+        # Wait for the next complete frame
+        # The protocol aborts the connection if nothing arrives within the timeout
+        message_bytes = await self.protocol.read_frame()
 
         # Decode message
-        message_dict: dict[str, Any] = cbor2.loads(message_bytes)
-        if logging.getLogger().isEnabledFor(logging.DEBUG):
-            logging.debug(f"Message dict: {printer.pformat(message_dict)}")
+        message_dict = cbor2.loads(message_bytes)
+        if not isinstance(message_dict, dict):
+            raise ValueError(f"Expected a CBOR map, got {type(message_dict).__name__}")
 
         # Parse message
         message = ServerMessage.parse(message_dict)
-        if logging.getLogger().isEnabledFor(logging.DEBUG):
-            logging.debug(f"Received message: {printer.pformat(message)}")
+        logging.debug("Received %r (%d bytes)", message, len(message_bytes))
 
         return message
 
@@ -166,33 +411,57 @@ class Client:
             message (ClientMessage): The message to send
         """
 
-        if self.writer is None:
-            raise ConnectionError("Client not connected")
+        await self.send_messages([message])
 
-        if logging.getLogger().isEnabledFor(logging.DEBUG):
-            logging.debug(f"Sending message to server: {printer.pformat(message)}")
+    async def send_messages(self, messages: Iterable[ClientMessage]):
+        """Send a batch of messages to the server
 
-        # Message is serialized as a dictionary
-        message_dict = vars(message)
-        if logging.getLogger().isEnabledFor(logging.DEBUG):
-            logging.debug(f"Message dict: {printer.pformat(message_dict)}")
+        All frames are handed to the transport before waiting for it to drain once,
+        instead of draining after every message.
 
-        # Binary message
-        message_bytes = cbor2.dumps(message_dict)
+        Args:
+            messages (Iterable[ClientMessage]): The messages to send, in order
+        """
 
-        # Calculate message length
-        length: int = len(message_bytes)
-        logging.debug(f"Message length: {length} bytes")
-        length_bytes = struct.pack(">I", length)
+        if self.transport is None or self.protocol is None:
+            raise ConnectionError("Client not connected")
 
-        # Write the 4-byte length prefix and then the message payload
-        self.writer.write(length_bytes)
-        self.writer.write(message_bytes)
+        # Write all the frames at once
+        # The transport only skips empty batches when given a sized sequence
+        frames = [self._encode_frame(message) for message in messages]
+        if not frames:
+            return
+        self.transport.writelines(frames)
 
         # Ensure the data is actually sent
-        await asyncio.wait_for(self.writer.drain(), timeout=self.timeout)
+        await self.protocol.drain()
 
-        logging.debug("Message successfully sent")
+    def _encode_frame(self, message: ClientMessage) -> memoryview:
+        """Encode a message as a length-prefixed frame
+
+        Args:
+            message (ClientMessage): The message to encode
+        """
+
+        # Message is serialized as a dictionary
+        message_dict = message.to_dict()
+
+        # Encode the message right after a placeholder for the 4-byte length prefix,
+        # so that the prefix and the payload share a single buffer
+        # A new stream is used for each frame, since the transport may still hold
+        # the buffers of earlier frames
+        stream = io.BytesIO()
+        _ = stream.write(bytes(LENGTH_PREFIX.size))
+        self.encoder.fp = stream
+        self.encoder.encode(message_dict)
+        frame = stream.getbuffer()
+
+        # Fill in the message length
+        length: int = len(frame) - LENGTH_PREFIX.size
+        LENGTH_PREFIX.pack_into(frame, 0, length)
+        logging.debug("Sending %r (%d bytes)", message, length)
+
+        return frame
 
     async def handshake(self):
         """Perform the handshake with the server"""
@@ -1,4 +1,5 @@
-from abc import ABC
+from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any, final, override
 
@@ -12,23 +13,20 @@ from sternhalma import Player, Scores
 class GameResult(ABC):
     """Abstract class for the result of a game"""
 
+    __slots__ = ()
+
     @classmethod
     def parse(cls, result: dict[str, Any]) -> "GameResult":
-        match result["type"]:
-            # Maximum number of turns reached
-            case "max_turns":
-                return GameResultMaxTurns.parse(result)
-
-            # Game has a winner
-            case "finished":
-                return GameResultFinished.parse(result)
+        type_ = result.get("type")
+        parser = _GAME_RESULT_PARSERS.get(type_) if isinstance(type_, str) else None
+        if parser is None:
+            raise ValueError(f"Unexpected game result type: {type_}")
 
-            case _:
-                raise ValueError(f"Unexpected game result type: {result.get('type')}")
+        return parser(result)
 
 
 @final
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameResultMaxTurns(GameResult):
     """Game has reached its maximum number of turns
 
@@ -50,7 +48,7 @@ class GameResultMaxTurns(GameResult):
 
 
 @final
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameResultFinished(GameResult):
     """The game has been played until completion
 
@@ -74,43 +72,33 @@ class GameResultFinished(GameResult):
         )
 
 
+# Parsers for each game result type
+_GAME_RESULT_PARSERS: dict[str, Callable[[dict[str, Any]], GameResult]] = {
+    # Maximum number of turns reached
+    "max_turns": GameResultMaxTurns.parse,
+    # Game has a winner
+    "finished": GameResultFinished.parse,
+}
+
+
 # Server -> Client
 class ServerMessage(ABC):
     """Message from Server to Client"""
 
+    __slots__ = ()
+
     @classmethod
     def parse(cls, message: dict[str, Any]) -> "ServerMessage":
-        match message.get("type"):
-            # Server welcomes the client
-            case "welcome":
-                return ServerMessageWelcome.parse(message)
-
-            # Server rejects the client
-            case "reject":
-                return ServerMessageReject.parse(message)
-
-            # Disconnection request
-            case "disconnect":
-                return ServerMessageDisconnect.parse(message)
-
-            # It's the player's turn
-            case "turn":
-                return ServerMessageTurn.parse(message)
-
-            # Player made a movement
-            case "movement":
-                return ServerMessageMovement.parse(message)
-
-            # Game has finished
-            case "game_finished":
-                return ServerMessageGameFinished.parse(message)
+        type_ = message.get("type")
+        parser = _SERVER_MESSAGE_PARSERS.get(type_) if isinstance(type_, str) else None
+        if parser is None:
+            raise ValueError(f"Unexpected message type: {type_}")
 
-            case _:
-                raise ValueError(f"Unexpected message type: {message.get('type')}")
+        return parser(message)
 
 
 @final
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ServerMessageWelcome(ServerMessage):
     """Server accepts the connection from the client and assigns a session ID
 
@@ -129,7 +117,7 @@ class ServerMessageWelcome(ServerMessage):
 
 
 @final
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ServerMessageReject(ServerMessage):
     """Server rejects the connection from the client
 
@@ -146,7 +134,7 @@ class ServerMessageReject(ServerMessage):
 
 
 @final
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ServerMessageDisconnect(ServerMessage):
     """Server requests that the client disconnects"""
 
@@ -157,7 +145,7 @@ class ServerMessageDisconnect(ServerMessage):
 
 
 @final
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ServerMessageTurn(ServerMessage):
     """Server informs the client the it is their turn to play
 
@@ -170,11 +158,16 @@ class ServerMessageTurn(ServerMessage):
     @override
     @classmethod
     def parse(cls, message: dict[str, Any]) -> "ServerMessage":
-        return cls(movements=np.array(message["movements"]))
+        return cls(movements=np.asarray(message["movements"], dtype=np.int_))
+
+    @override
+    def __repr__(self) -> str:
+        # Summarize the available moves, which can be numerous, instead of listing them
+        return f"{type(self).__name__}(movements=<{len(self.movements)} movements>)"
 
 
 @final
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ServerMessageMovement(ServerMessage):
     """Server informs that client that a movement was made on the board
 
@@ -192,13 +185,13 @@ class ServerMessageMovement(ServerMessage):
     def parse(cls, message: dict[str, Any]) -> "ServerMessage":
         return cls(
             player=Player(message["player"]),
-            movement=np.array(message["movement"]),
+            movement=np.asarray(message["movement"], dtype=np.int_),
             scores=message["scores"],
         )
 
 
 @final
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ServerMessageGameFinished(ServerMessage):
     """Server informs the client that the game has finished and its result
 
@@ -215,25 +208,49 @@ class ServerMessageGameFinished(ServerMessage):
         return cls(result=GameResult.parse(message["result"]))
 
 
+# Parsers for each server message type
+_SERVER_MESSAGE_PARSERS: dict[str, Callable[[dict[str, Any]], ServerMessage]] = {
+    # Server welcomes the client
+    "welcome": ServerMessageWelcome.parse,
+    # Server rejects the client
+    "reject": ServerMessageReject.parse,
+    # Disconnection request
+    "disconnect": ServerMessageDisconnect.parse,
+    # It's the player's turn
+    "turn": ServerMessageTurn.parse,
+    # Player made a movement
+    "movement": ServerMessageMovement.parse,
+    # Game has finished
+    "game_finished": ServerMessageGameFinished.parse,
+}
+
+
 # Client -> Server
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClientMessage(ABC):
     """Message from Client to Server
     Every client message must provide a `type: str` field."""
 
-    pass
+    @abstractmethod
+    def to_dict(self) -> dict[str, Any]:
+        """Fields of the message to be serialized"""
+        pass
 
 
 @final
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClientMessageHello(ClientMessage):
     """Client initiates a new session"""
 
     type: str = "hello"
 
+    @override
+    def to_dict(self) -> dict[str, Any]:
+        return {"type": self.type}
+
 
 @final
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClientMessageReconnect(ClientMessage):
     """Client requests to reconnect to an existing session
 
@@ -244,9 +261,13 @@ class ClientMessageReconnect(ClientMessage):
     session_id: str
     type: str = "reconnect"
 
+    @override
+    def to_dict(self) -> dict[str, Any]:
+        return {"type": self.type, "session_id": self.session_id}
+
 
 @final
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClientMessageChoice(ClientMessage):
     """Client has chosen a movement index from the list of available ones
 
@@ -256,3 +277,7 @@ class ClientMessageChoice(ClientMessage):
 
     movement_index: int
     type: str = "choice"
+
+    @override
+    def to_dict(self) -> dict[str, Any]:
+        return {"type": self.type, "movement_index": self.movement_index}
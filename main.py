@@ -2,6 +2,14 @@ import argparse
 import asyncio
 import logging
 
+try:
+    # Optional libuv-based event loop, used when installed
+    import uvloop  # pyright: ignore [reportMissingImports]
+
+    loop_factory = uvloop.new_event_loop
+except ImportError:
+    loop_factory = None
+
 
 from agent import Agent, AgentBrownian
 from client.client import Client
@@ -63,7 +71,8 @@ async def play(agent: Agent, client: Client):
 async def main():
     # Parse command-line arguments
     args = parser.parse_args()
-    logging.debug(f"Arguments: {printer.pformat(vars(args))}")
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug("Arguments: %s", printer.pformat(vars(args)))
 
     host = str(args.host)
     port = int(args.port)
@@ -87,6 +96,6 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        asyncio.run(main(), loop_factory=loop_factory)
     except KeyboardInterrupt:
         logging.info("Client stopped by user.")
@@ -5,7 +5,9 @@ It includes definitions for the board, players, valid positions, and metrics for
 on the hexagonal grid.
 """
 
-from dataclasses import dataclass
+import copy
+import math
+from dataclasses import dataclass, field
 from enum import IntEnum
 from typing import final, override
 
@@ -40,20 +42,24 @@ type BoardIndex = NDArray[np.int_]
 
 
 # How many steps it takes to get from one cell to another
-def hexagonal_metric(d: BoardIndex) -> np.int_:
+def hexagonal_metric(d: BoardIndex) -> int:
     """
     Calculates the hexagonal distance metric (Manhattan distance on hex grid) from the origin.
 
+    The two components are converted to Python integers, as building NumPy arrays for
+    three values costs far more than the arithmetic itself.
+
     Args:
         d: The difference vector in axial coordinates.
 
     Returns:
         The number of steps to reach the destination from the origin.
     """
-    return np.max(np.abs([d[0], d[1], d[0] + d[1]]))
+    q, r = int(d[0]), int(d[1])
+    return max(abs(q), abs(r), abs(q + r))
 
 
-def hexagonal_distance(i: BoardIndex, j: BoardIndex) -> np.int_:
+def hexagonal_distance(i: BoardIndex, j: BoardIndex) -> int:
     """
     Calculates the number of steps (distance) between two hexagonal coordinates.
 
@@ -68,7 +74,7 @@ def hexagonal_distance(i: BoardIndex, j: BoardIndex) -> np.int_:
 
 
 # Euclidean metric on the hexagonal grid
-def euclidean_metric(d: BoardIndex) -> np.float64:
+def euclidean_metric(d: BoardIndex) -> float:
     """
     Calculates the Euclidean distance from the origin in the hexagonal grid embedding.
 
@@ -82,10 +88,28 @@ def euclidean_metric(d: BoardIndex) -> np.float64:
     Returns:
         The Euclidean distance.
     """
-    return np.sqrt(np.square(d[0] + d[1]) - (d[0] * d[1]))
+    q, r = int(d[0]), int(d[1])
+    return math.sqrt((q + r) * (q + r) - q * r)
+
+
+def euclidean_metric_batch(d: NDArray[np.int_]) -> NDArray[np.float64]:
+    """
+    Calculates the Euclidean distance from the origin for many difference vectors at once.
+
+    Uses the same formula as `euclidean_metric`, vectorized over the rows of `d`, for
+    scoring whole batches of movements in a single pass.
+
+    Args:
+        d: Array of shape (N, 2) of difference vectors.
+
+    Returns:
+        Array of shape (N,) with the Euclidean distances.
+    """
+    q, r = d[:, 0], d[:, 1]
+    return np.sqrt(np.square(q + r) - q * r)
 
 
-def euclidean_distance(i: BoardIndex, j: BoardIndex) -> np.float64:
+def euclidean_distance(i: BoardIndex, j: BoardIndex) -> float:
     """
     Calculates the Euclidean distance between two coordinates.
 
@@ -157,11 +181,8 @@ class Position(IntEnum):
 
     @classmethod
     def with_player(cls, player: Player) -> "Position":
-        match player:
-            case Player.Player1:
-                return Position.Player1
-            case Player.Player2:
-                return Position.Player2
+        # Each player's pieces share its value, so the player indexes its position
+        return _POSITION_BY_VALUE[player]
 
     @override
     def __str__(self) -> str:
@@ -176,6 +197,32 @@ class Position(IntEnum):
                 return f"{Player.Player2} "
 
 
+# Members of `Position` indexed by their raw value
+# `Position.Invalid` (-1) is last, so it is reached by negative indexing.
+_POSITION_BY_VALUE: tuple[Position, ...] = (
+    Position.Empty,
+    Position.Player1,
+    Position.Player2,
+    Position.Invalid,
+)
+
+
+# Zobrist keys used to hash board states
+# One random 64-bit key per (row, column, cell state). Cell states are indexed by their
+# raw `Position` value, so `Position.Invalid` (-1) maps to the last key of each cell.
+# The generator is seeded so hashes are reproducible across runs.
+ZOBRIST_KEYS: NDArray[np.uint64] = np.random.default_rng(0).integers(
+    0,
+    np.iinfo(np.uint64).max,
+    size=(17, 17, len(Position)),
+    dtype=np.uint64,
+    endpoint=True,
+)
+
+# Row and column indices of every cell, used to gather the Zobrist keys of a whole board
+_ROWS, _COLS = np.indices((17, 17))
+
+
 # Movement of a piece on the board represented by a pair of board indices (Start, End)
 # Array of shape (2, 2) where [0] is start position and [1] is end position.
 # Array of shape (2, 2)
@@ -189,33 +236,57 @@ class Board:
     Represents the game board state.
 
     The state is a 17x17 grid where valid positions form the star shape.
-    Values in the grid are integers mapping to `Position` enum.
+    Values in the grid are integers mapping to `Position` enum, stored as `int8` so that
+    a whole board fits in a few cache lines and is cheap to copy.
+
+    The Zobrist hash of the state is maintained incrementally, so cells must be modified
+    through item assignment or movements rather than by writing to `state` directly.
     """
 
-    state: NDArray[np.int32]
+    state: NDArray[np.int8]
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._hash = int(
+            np.bitwise_xor.reduce(ZOBRIST_KEYS[_ROWS, _COLS, self.state], axis=None)
+        )
 
     @classmethod
     def empty(cls) -> "Board":
         """Creates an empty board with all valid positions set to Empty."""
 
-        state = np.full((17, 17), Position.Invalid, dtype=np.int32)
-        state[VALID_POSITIONS] = Position.Empty
-        return cls(state=state)
+        return _EMPTY_BOARD.copy()
 
     @classmethod
     def two_players(cls) -> "Board":
         """Creates a standard starting board for a 2-player game."""
 
-        board = cls.empty()
-        board.state[PLAYER1_STARTING_POSITIONS] = Position.Player1
-        board.state[PLAYER2_STARTING_POSITIONS] = Position.Player2
-        return board
+        return _TWO_PLAYERS_BOARD.copy()
+
+    def copy(self) -> "Board":
+        """
+        Returns an independent copy of the board.
 
-    def __getitem__(self, idx: BoardIndex) -> Position:
-        return Position(self.state[tuple(idx)])
+        The state array is copied and every other field, including the hash, is carried
+        over, so the copy does not need to rehash the whole board.
+        """
+        board = copy.copy(self)
+        board.state = self.state.copy()
+        return board
 
-    def __setitem__(self, idx: BoardIndex, position: Position) -> None:
-        self.state[tuple(idx)] = position
+    def __getitem__(self, idx: BoardIndex | tuple[int, int]) -> Position:
+        # Tuple lookup instead of calling the enum constructor on every cell read
+        return _POSITION_BY_VALUE[self.state[tuple(idx)]]
+
+    def __setitem__(
+        self, idx: BoardIndex | tuple[int, int], position: Position
+    ) -> None:
+        cell = tuple(idx)
+        # Swap the key of the previous cell state for the key of the new one
+        self._hash ^= int(ZOBRIST_KEYS[*cell, self.state[cell]]) ^ int(
+            ZOBRIST_KEYS[*cell, position]
+        )
+        self.state[cell] = position
 
     def apply_movement(self, movement: Movement) -> None:
         """
@@ -224,8 +295,37 @@ class Board:
         Args:
             movement: A (2, 2) array where [0] is start index and [1] is end index.
         """
-        self[movement[1]] = self[movement[0]]
-        self[movement[0]] = Position.Empty
+        start, end = tuple(movement[0]), tuple(movement[1])
+        self[end] = self[start]
+        self[start] = Position.Empty
+
+    def undo_movement(self, movement: Movement) -> None:
+        """
+        Reverts a movement previously applied with `apply_movement`, in-place.
+
+        Pieces are never captured in Sternhalma, so moving the piece back to its start
+        restores the exact previous state. This lets tree search walk down and back up
+        a single board instead of copying it for every simulated move.
+
+        Args:
+            movement: The same (2, 2) array that was passed to `apply_movement`.
+        """
+        start, end = tuple(movement[0]), tuple(movement[1])
+        self[start] = self[end]
+        self[end] = Position.Empty
+
+    def zobrist_hash(self) -> int:
+        """
+        Returns the Zobrist hash of the board state.
+
+        Equal board states always produce the same hash, which makes it suitable as a key
+        for caching evaluations of previously seen positions. The hash is updated on every
+        cell assignment, so this is a constant-time lookup.
+
+        Returns:
+            The 64-bit hash as a Python integer.
+        """
+        return self._hash
 
     def to_string(self) -> str:
         """Returns a string representation of the board for debugging."""
@@ -237,6 +337,20 @@ class Board:
         )
 
 
+# Templates of the standard boards, built and hashed once and then copied on demand
+# Their states are read-only so that the templates themselves can never be modified.
+_EMPTY_STATE = np.full((17, 17), Position.Invalid, dtype=np.int8)
+_EMPTY_STATE[VALID_POSITIONS] = Position.Empty
+_EMPTY_STATE.setflags(write=False)
+_EMPTY_BOARD = Board(state=_EMPTY_STATE)
+
+_TWO_PLAYERS_STATE = _EMPTY_STATE.copy()
+_TWO_PLAYERS_STATE[PLAYER1_STARTING_POSITIONS] = Position.Player1
+_TWO_PLAYERS_STATE[PLAYER2_STARTING_POSITIONS] = Position.Player2
+_TWO_PLAYERS_STATE.setflags(write=False)
+_TWO_PLAYERS_BOARD = Board(state=_TWO_PLAYERS_STATE)
+
+
 # Scores of each player
 type Scores = tuple[int, int]
 
@@ -0,0 +1,105 @@
+import copy
+import unittest
+
+import numpy as np
+import torch as T
+
+from alphazero import EvaluationCache, SternhalmaZero, from_states
+from sternhalma import BOARD_MASK, Board, Position
+
+
+def make_model() -> SternhalmaZero:
+    """Small model in evaluation mode, with non-trivial batch normalization statistics"""
+
+    _ = T.manual_seed(0)
+    model = SternhalmaZero(board_size=17, num_actions=10, num_res_blocks=2)
+    for module in model.modules():
+        if isinstance(module, T.nn.BatchNorm2d):
+            module.running_mean.uniform_(-0.5, 0.5)
+            module.running_var.uniform_(0.5, 1.5)
+            _ = T.nn.init.uniform_(module.weight, 0.5, 1.5)
+            _ = T.nn.init.uniform_(module.bias, -0.5, 0.5)
+
+    return model.eval()
+
+
+class TestFromStates(unittest.TestCase):
+    def test_channels(self):
+        board = Board.two_players()
+        x = from_states([board], device="cpu")
+        self.assertEqual(x.shape, (1, 3, 17, 17))
+
+        state = board.state
+        expected = np.stack(
+            [
+                state == Position.Player1,
+                state == Position.Player2,
+                state != Position.Invalid,
+            ]
+        ).astype(np.float32)
+        T.testing.assert_close(x[0], T.from_numpy(expected))
+        T.testing.assert_close(x[0, 2], T.from_numpy(BOARD_MASK))
+
+
+class TestSternhalmaZero(unittest.TestCase):
+    def setUp(self):
+        self.x = from_states([Board.two_players(), Board.empty()], device="cpu")
+
+    def test_predict_matches_forward(self):
+        model = make_model()
+        with T.no_grad():
+            expected_policy, expected_value = model(self.x)
+
+        policy, value = model.prepare_inference().predict(self.x)
+        self.assertEqual(policy.shape, (2, 10))
+        self.assertEqual(value.shape, (2, 1))
+        # Channels-last kernels may accumulate in a different order
+        T.testing.assert_close(policy, expected_policy, rtol=1e-4, atol=1e-4)
+        T.testing.assert_close(value, expected_value, rtol=1e-4, atol=1e-4)
+
+    def test_fused_matches_unfused(self):
+        model = make_model()
+        fused = copy.deepcopy(model).fuse_for_inference()
+
+        with T.no_grad():
+            expected_policy, expected_value = model(self.x)
+            policy, value = fused(self.x)
+
+        T.testing.assert_close(policy, expected_policy, rtol=1e-4, atol=1e-4)
+        T.testing.assert_close(value, expected_value, rtol=1e-4, atol=1e-4)
+
+
+class TestEvaluationCache(unittest.TestCase):
+    def setUp(self):
+        self.model = make_model().prepare_inference()
+
+    def test_cached_results_are_copies(self):
+        cache = EvaluationCache(self.model, capacity=4, device="cpu")
+        board = Board.two_players()
+
+        policy, value = cache.evaluate(board)
+        expected_policy, expected_value = policy.clone(), value.clone()
+
+        # Modifying a result in-place does not affect the cached evaluation
+        _ = policy.zero_()
+        _ = value.zero_()
+        policy, value = cache.evaluate(board)
+        T.testing.assert_close(policy, expected_policy)
+        T.testing.assert_close(value, expected_value)
+        self.assertEqual(len(cache.entries), 1)
+
+    def test_eviction(self):
+        cache = EvaluationCache(self.model, capacity=1, device="cpu")
+        empty, start = Board.empty(), Board.two_players()
+
+        _ = cache.evaluate(empty)
+        _ = cache.evaluate(start)
+        self.assertEqual(list(cache.entries), [start.zobrist_hash()])
+
+    def test_invalid_capacity(self):
+        with self.assertRaises(ValueError):
+            _ = EvaluationCache(self.model, capacity=0, device="cpu")
+
+
+if __name__ == "__main__":
+    unittest.main()
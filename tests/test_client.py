@@ -0,0 +1,240 @@
+import asyncio
+import socket
+import unittest
+from typing import override
+
+from client.client import Client, FrameProtocol
+
+
+class FakeTransport(asyncio.Transport):
+    """Transport that reports aborts and closes back to the protocol"""
+
+    def __init__(self, protocol: FrameProtocol):
+        super().__init__()
+        self.protocol = protocol
+        self.aborted = False
+        self.reading = True
+        # Data passed to each `writelines` call
+        self.writes: list[list[bytes]] = []
+
+    @override
+    def abort(self) -> None:
+        self.aborted = True
+        self.protocol.connection_lost(None)
+
+    @override
+    def close(self) -> None:
+        self.protocol.connection_lost(None)
+
+    @override
+    def pause_reading(self) -> None:
+        self.reading = False
+
+    @override
+    def resume_reading(self) -> None:
+        self.reading = True
+
+    @override
+    def writelines(self, list_of_data) -> None:  # pyright: ignore [reportMissingParameterType]
+        self.writes.append(list(list_of_data))
+
+
+def connect(protocol: FrameProtocol) -> FakeTransport:
+    transport = FakeTransport(protocol)
+    protocol.connection_made(transport)
+    return transport
+
+
+def feed(
+    protocol: FrameProtocol, data: bytes, chunk_size: int | None = None
+) -> None:
+    """Hand `data` to the protocol as the transport would, `chunk_size` bytes at a time"""
+
+    while data:
+        buffer = protocol.get_buffer(-1)
+        size = min(len(buffer), len(data), chunk_size or len(data))
+        buffer[:size] = data[:size]
+        protocol.buffer_updated(size)
+        data = data[size:]
+
+
+def frame(payload: bytes) -> bytes:
+    return len(payload).to_bytes(4, "big") + payload
+
+
+class TestFrameProtocol(unittest.IsolatedAsyncioTestCase):
+    async def test_frame_split_across_reads(self):
+        protocol = FrameProtocol(buffer_size=64)
+        _ = connect(protocol)
+
+        payload = bytes(range(50))
+        feed(protocol, frame(payload), chunk_size=3)
+        self.assertEqual(await protocol.read_frame(), payload)
+
+    async def test_several_frames_in_one_read(self):
+        protocol = FrameProtocol(buffer_size=64)
+        _ = connect(protocol)
+
+        payloads = [b"first", b"", b"third frame"]
+        # The last frame is incomplete and must be kept for the next read
+        data = b"".join(map(frame, payloads)) + frame(b"fourth")[:5]
+        feed(protocol, data)
+        for payload in payloads:
+            self.assertEqual(await protocol.read_frame(), payload)
+        self.assertTrue(protocol.frames.empty())
+
+        feed(protocol, frame(b"fourth")[5:])
+        self.assertEqual(await protocol.read_frame(), b"fourth")
+
+    async def test_frame_larger_than_buffer(self):
+        protocol = FrameProtocol(buffer_size=16)
+        _ = connect(protocol)
+
+        payload = bytes(i % 256 for i in range(1000))
+        feed(protocol, frame(payload) + frame(b"next"), chunk_size=7)
+        self.assertEqual(await protocol.read_frame(), payload)
+        self.assertEqual(await protocol.read_frame(), b"next")
+        self.assertGreaterEqual(len(protocol.buffer), len(frame(payload)))
+
+    async def test_eof_mid_frame(self):
+        protocol = FrameProtocol(buffer_size=64)
+        transport = connect(protocol)
+
+        feed(protocol, frame(b"complete") + frame(b"truncated")[:6])
+        transport.close()
+
+        self.assertEqual(await protocol.read_frame(), b"complete")
+        with self.assertRaises(ConnectionResetError):
+            _ = await protocol.read_frame()
+        # The end of the stream is reported to every later read
+        with self.assertRaises(ConnectionResetError):
+            _ = await protocol.read_frame()
+
+
+class TestFrameProtocolFlowControl(unittest.IsolatedAsyncioTestCase):
+    async def test_reading_paused_while_frames_are_queued(self):
+        protocol = FrameProtocol(buffer_size=64, max_queued_frames=3)
+        transport = connect(protocol)
+
+        feed(protocol, frame(b"first") + frame(b"second"))
+        self.assertTrue(transport.reading)
+
+        feed(protocol, frame(b"third") + frame(b"fourth"))
+        self.assertFalse(transport.reading)
+
+        # Reading resumes once the queue is back under the limit
+        self.assertEqual(await protocol.read_frame(), b"first")
+        self.assertFalse(transport.reading)
+        self.assertEqual(await protocol.read_frame(), b"second")
+        self.assertTrue(transport.reading)
+
+        for payload in (b"third", b"fourth"):
+            self.assertEqual(await protocol.read_frame(), payload)
+        self.assertTrue(transport.reading)
+
+
+class TestFrameProtocolTimeout(unittest.IsolatedAsyncioTestCase):
+    async def test_idle_time_between_reads_is_not_counted(self):
+        protocol = FrameProtocol(timeout=0.2)
+        transport = connect(protocol)
+
+        # The agent thinks for longer than the timeout before reading again
+        await asyncio.sleep(0.3)
+
+        loop = asyncio.get_running_loop()
+        _ = loop.call_later(0.1, feed, protocol, frame(b"reply"))
+        self.assertEqual(await protocol.read_frame(), b"reply")
+        self.assertFalse(transport.aborted)
+
+    async def test_read_times_out(self):
+        protocol = FrameProtocol(timeout=0.1)
+        transport = connect(protocol)
+
+        with self.assertRaises(TimeoutError):
+            _ = await protocol.read_frame()
+        self.assertTrue(transport.aborted)
+
+        # Later operations report the same error
+        with self.assertRaises(TimeoutError):
+            await protocol.drain()
+
+    async def test_partial_frame_keeps_read_alive(self):
+        protocol = FrameProtocol(timeout=0.2)
+        _ = connect(protocol)
+
+        data = frame(b"slow reply")
+        loop = asyncio.get_running_loop()
+        # Each chunk arrives within the timeout, but the whole frame takes longer
+        for i in range(len(data)):
+            _ = loop.call_later(0.05 * (i + 1), feed, protocol, data[i : i + 1])
+
+        self.assertEqual(await protocol.read_frame(), b"slow reply")
+
+
+class TestClientReceive(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.client = Client()
+        self.protocol = FrameProtocol()
+        self.client.protocol = self.protocol
+        self.client.transport = connect(self.protocol)
+
+    async def test_non_map_payload(self):
+        # CBOR encoding of the integer 1
+        feed(self.protocol, frame(b"\x01"))
+        with self.assertRaises(ValueError):
+            _ = await self.client.receive_message()
+
+    async def test_oversized_frame(self):
+        protocol = FrameProtocol(buffer_size=64, max_frame_size=1024)
+        self.client.protocol = protocol
+        transport = connect(protocol)
+
+        # Only the length prefix of the oversized frame has arrived
+        feed(protocol, (1025).to_bytes(4, "big"))
+        with self.assertRaises(ValueError):
+            _ = await self.client.receive_message()
+
+        self.assertTrue(transport.aborted)
+        self.assertEqual(len(protocol.buffer), 64)
+
+
+class TestClientSend(unittest.IsolatedAsyncioTestCase):
+    async def test_empty_batch(self):
+        client = Client()
+        client.protocol = FrameProtocol()
+        transport = connect(client.protocol)
+        client.transport = transport
+
+        # The transport must not be handed an empty batch at all
+        await client.send_messages([])
+        self.assertEqual(transport.writes, [])
+
+
+class TestClientConnect(unittest.IsolatedAsyncioTestCase):
+    async def test_socket_buffer_size(self):
+        writers: list[asyncio.StreamWriter] = []
+
+        def accept(_reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+            writers.append(writer)
+
+        server = await asyncio.start_server(accept, "127.0.0.1", 0)
+        port: int = server.sockets[0].getsockname()[1]
+
+        size, value = 8192, 0
+        async with server:
+            async with Client(port=port, socket_buffer_size=size) as client:
+                assert client.transport is not None
+                sock = client.transport.get_extra_info("socket")
+                value = sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+
+            # The server waits for its connections to close before shutting down
+            for writer in writers:
+                writer.close()
+
+        # Linux reports twice the requested size to account for bookkeeping
+        self.assertGreaterEqual(value, size)
+        self.assertLessEqual(value, 2 * size)
+
+
+if __name__ == "__main__":
+    unittest.main()
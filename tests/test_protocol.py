@@ -0,0 +1,112 @@
+import unittest
+
+import numpy as np
+
+from client.protocol import (
+    ClientMessageChoice,
+    ClientMessageHello,
+    ClientMessageReconnect,
+    GameResult,
+    GameResultFinished,
+    GameResultMaxTurns,
+    ServerMessage,
+    ServerMessageDisconnect,
+    ServerMessageGameFinished,
+    ServerMessageMovement,
+    ServerMessageReject,
+    ServerMessageTurn,
+    ServerMessageWelcome,
+)
+from sternhalma import Player
+
+
+class TestServerMessageParse(unittest.TestCase):
+    def test_welcome(self):
+        message = ServerMessage.parse({"type": "welcome", "session_id": "abc"})
+        self.assertEqual(message, ServerMessageWelcome(session_id="abc"))
+
+    def test_reject(self):
+        message = ServerMessage.parse({"type": "reject", "reason": "Server full"})
+        self.assertEqual(message, ServerMessageReject(reason="Server full"))
+
+    def test_disconnect(self):
+        message = ServerMessage.parse({"type": "disconnect"})
+        self.assertIsInstance(message, ServerMessageDisconnect)
+
+    def test_turn(self):
+        message = ServerMessage.parse(
+            {"type": "turn", "movements": [[[12, 4], [11, 4]], [[12, 5], [11, 5]]]}
+        )
+        assert isinstance(message, ServerMessageTurn)
+        np.testing.assert_array_equal(
+            message.movements, [[[12, 4], [11, 4]], [[12, 5], [11, 5]]]
+        )
+
+    def test_turn_repr(self):
+        message = ServerMessage.parse(
+            {"type": "turn", "movements": [[[12, 4], [11, 4]], [[12, 5], [11, 5]]]}
+        )
+        self.assertEqual(repr(message), "ServerMessageTurn(movements=<2 movements>)")
+
+    def test_movement(self):
+        message = ServerMessage.parse(
+            {
+                "type": "movement",
+                "player": 2,
+                "movement": [[4, 8], [5, 8]],
+                "scores": [0, 1],
+            }
+        )
+        assert isinstance(message, ServerMessageMovement)
+        self.assertEqual(message.player, Player.Player2)
+        np.testing.assert_array_equal(message.movement, [[4, 8], [5, 8]])
+
+    def test_game_finished(self):
+        message = ServerMessage.parse(
+            {
+                "type": "game_finished",
+                "result": {"type": "max_turns", "total_turns": 100, "scores": [3, 4]},
+            }
+        )
+        assert isinstance(message, ServerMessageGameFinished)
+        assert isinstance(message.result, GameResultMaxTurns)
+        self.assertEqual(message.result.total_turns, 100)
+        self.assertEqual(list(message.result.scores), [3, 4])
+
+    def test_unexpected_type(self):
+        with self.assertRaises(ValueError):
+            _ = ServerMessage.parse({"type": "unknown"})
+
+        with self.assertRaises(ValueError):
+            _ = ServerMessage.parse({})
+
+
+class TestGameResultParse(unittest.TestCase):
+    def test_finished(self):
+        result = GameResult.parse(
+            {"type": "finished", "winner": 1, "total_turns": 42, "scores": [15, 10]}
+        )
+        assert isinstance(result, GameResultFinished)
+        self.assertEqual(result.winner, Player.Player1)
+        self.assertEqual(result.total_turns, 42)
+        self.assertEqual(list(result.scores), [15, 10])
+
+    def test_unexpected_type(self):
+        with self.assertRaises(ValueError):
+            _ = GameResult.parse({"type": "unknown"})
+
+
+class TestClientMessageToDict(unittest.TestCase):
+    def test_to_dict(self):
+        self.assertEqual(ClientMessageHello().to_dict(), {"type": "hello"})
+        self.assertEqual(
+            ClientMessageReconnect("abc").to_dict(),
+            {"type": "reconnect", "session_id": "abc"},
+        )
+        self.assertEqual(
+            ClientMessageChoice(3).to_dict(), {"type": "choice", "movement_index": 3}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
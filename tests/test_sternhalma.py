@@ -0,0 +1,96 @@
+import unittest
+
+import numpy as np
+
+from sternhalma import (
+    Board,
+    Player,
+    Position,
+    euclidean_metric,
+    euclidean_metric_batch,
+    hexagonal_distance,
+    hexagonal_metric,
+)
+
+
+class TestBoard(unittest.TestCase):
+    def test_undo_movement(self):
+        board = Board.two_players()
+        initial = board.state.copy()
+
+        movement = np.array([[12, 4], [11, 4]])
+        board.apply_movement(movement)
+        self.assertEqual(board[movement[0]], Position.Empty)
+        self.assertEqual(board[movement[1]], Position.Player1)
+
+        board.undo_movement(movement)
+        np.testing.assert_array_equal(board.state, initial)
+
+    def test_zobrist_hash_incremental(self):
+        board = Board.two_players()
+        initial_hash = board.zobrist_hash()
+
+        movement = np.array([[12, 4], [11, 4]])
+        board.apply_movement(movement)
+        self.assertNotEqual(board.zobrist_hash(), initial_hash)
+        # The incremental hash matches a hash computed from scratch
+        self.assertEqual(
+            board.zobrist_hash(), Board(state=board.state.copy()).zobrist_hash()
+        )
+
+        board.undo_movement(movement)
+        self.assertEqual(board.zobrist_hash(), initial_hash)
+
+    def test_copy_is_independent(self):
+        board = Board.two_players()
+        copy = board.copy()
+        self.assertEqual(copy.zobrist_hash(), board.zobrist_hash())
+
+        copy.apply_movement(np.array([[12, 4], [11, 4]]))
+        self.assertEqual(board[np.array([12, 4])], Position.Player1)
+        self.assertEqual(
+            copy.zobrist_hash(), Board(state=copy.state.copy()).zobrist_hash()
+        )
+
+        # Boards built from the templates are fresh copies
+        self.assertIsNot(Board.two_players().state, Board.two_players().state)
+        self.assertNotEqual(board.zobrist_hash(), copy.zobrist_hash())
+
+    def test_getitem(self):
+        board = Board.two_players()
+        for cell in np.ndindex(board.state.shape):
+            self.assertIs(board[np.array(cell)], Position(board.state[cell]))
+
+
+class TestPosition(unittest.TestCase):
+    def test_with_player(self):
+        self.assertIs(Position.with_player(Player.Player1), Position.Player1)
+        self.assertIs(Position.with_player(Player.Player2), Position.Player2)
+
+
+class TestMetrics(unittest.TestCase):
+    def test_hexagonal_metric(self):
+        self.assertEqual(hexagonal_metric(np.array([0, 0])), 0)
+        self.assertEqual(hexagonal_metric(np.array([1, -1])), 1)
+        self.assertEqual(hexagonal_metric(np.array([2, 3])), 5)
+        self.assertEqual(hexagonal_metric(np.array([-4, 1])), 4)
+
+    def test_hexagonal_distance(self):
+        self.assertEqual(hexagonal_distance(np.array([12, 4]), np.array([4, 12])), 8)
+        self.assertEqual(hexagonal_distance(np.array([16, 4]), np.array([0, 12])), 16)
+
+    def test_euclidean_metric(self):
+        self.assertEqual(euclidean_metric(np.array([0, 0])), 0.0)
+        self.assertEqual(euclidean_metric(np.array([1, 0])), 1.0)
+        self.assertEqual(euclidean_metric(np.array([1, -1])), 1.0)
+        self.assertAlmostEqual(euclidean_metric(np.array([1, 1])), np.sqrt(3))
+
+    def test_euclidean_metric_batch(self):
+        d = np.array([[0, 0], [1, 0], [1, -1], [1, 1], [-3, 5]])
+        np.testing.assert_allclose(
+            euclidean_metric_batch(d), [euclidean_metric(row) for row in d]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()